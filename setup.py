@@ -1,5 +1,5 @@
 import setuptools
-from setuptools import setup, find_packages
+from setuptools import setup
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
@@ -20,12 +20,7 @@ setuptools.setup(
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License"
     ],
-    package_dir={'':"src"},
-    packages=find_packages("src"),
+    package_dir={'imprel':"src"},
+    packages=['imprel'],
     python_requires=">=3.6",
-    entry_points={
-                        'console_scripts': [
-                                'www=imprel.utils:sayHello',
-                        ]
-                }
 )
\ No newline at end of file
@@ -0,0 +1,251 @@
+"""
+Implementation of the command line interface for headless runs of the
+Structural Reliability Analysis (Classic and Imprecise). The analysis is
+described by a JSON config, run non-interactively and its results and
+timing metrics are written to a JSON file.
+
+    imprel run config.json [--output results.json] [--workers 4] [--seed 1]
+    imprel worker /shared/queue
+
+Config:
+-------
+{
+    "variables": [
+        {"type": "p", "name": "r", "dist": "norm", "params": [[1.0, 0.14], [1.1, 0.14]]},
+        {"type": "c", "name": "s", "dist": "norm", "params": {"loc": 0.2, "scale": 0.2}},
+        {"type": "i", "name": "e", "params": [0.1, 0.3]},
+        {"type": "d", "name": "a", "params": 1.0},
+        {"type": "h", "name": "h", "params": [1.0, 1.2, 0.9, 1.1]}
+    ],
+    "limit_state": "module:function",       # obj_function(x, *args)
+    "args": [],
+    "method": "scipy",                      # see Analysis.methods
+    "options": {}, "direction": null,       # method options
+    "sampler": "random",                    # random, lhs or sobol
+    "nsamples": 10000,                      # or the batch size with "cov"
+    "cov": null, "max_samples": 1000000,    # target coefficient of variation of pf
+    "workers": 0, "queue": null,            # local workers and/or shared queue
+    "seed": null,
+    "output": "results.json"
+}
+
+The modules of the limit states are searched in the directory of the
+config and in the working directory.
+
+"""
+
+import numpy as np
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+import importlib
+import subprocess
+#from utils import get_reliability_index             # use this line for tests
+#from Variables import initiate_variable             # use this line for tests
+#from Metrics import Metrics                         # use this line for tests
+#from Runer import Plan                              # use this line for tests
+#from Cluster import QueueAnalysis, WorkQueue, worker  # use this line for tests
+from . import *                                      # instead of this
+
+defaults = {
+    'args': [],
+    'method': 'scipy',
+    'options': None,
+    'direction': None,
+    'sampler': 'random',
+    'nsamples': 10000,
+    'cov': None,
+    'max_samples': 1000000,
+    'workers': 0,
+    'queue': None,
+    'shard_size': None,
+    'seed': None,
+    'output': 'results.json'
+    }
+
+logger = logging.getLogger('imprel')
+
+def load_config(path):
+    """Function to read the config file and to fill in the defaults."""
+    with open(path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    for key in ('variables', 'limit_state'):
+        if not key in config:
+            raise ValueError(f"Config has no '{key}'.")
+    unknown = set(config) - set(defaults) - {'variables', 'limit_state'}
+    if unknown:
+        raise ValueError(f"Unknown config keys: {', '.join(sorted(unknown))}")
+    return dict(defaults, **config)
+
+def get_variable(spec):
+    """Function to assign the variable from its config (see `initiate_variable`)."""
+    var_type, name, params = spec['type'], spec['name'], spec.get('params')
+    if var_type in ('c', 'p'):
+        import scipy.stats as stats
+        dist = getattr(stats, spec.get('dist', 'norm'))
+        def frozen(p):
+            return dist(**p) if isinstance(p, dict) else dist(*np.atleast_1d(p))
+        if var_type == 'c':
+            return initiate_variable('c', name, frozen(params))
+        return initiate_variable('p', name, [frozen(p) for p in params])
+    if var_type == 'i':
+        return initiate_variable('i', name, *params)
+    return initiate_variable(var_type, name, params)
+
+def load_function(reference, paths=()):
+    """Function to import the limit state from the 'module:function' reference."""
+    module, sep, function = reference.partition(':')
+    if not sep or not module or not function:
+        raise ValueError(f"Provide the limit state as 'module:function', not '{reference}'.")
+    for path in paths:
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    return getattr(importlib.import_module(module), function)
+
+def get_samples(sampler, nsamples, num_var, rng):
+    """Function to generate nsamples from [0,1] by the sampler
+    ('random', 'lhs' or 'sobol')."""
+    if sampler == 'random':
+        return rng.uniform(size=(nsamples, num_var))
+    from scipy.stats import qmc
+    engines = {
+        'lhs': qmc.LatinHypercube,
+        'sobol': qmc.Sobol
+        }
+    if not sampler in engines:
+        raise ValueError("Invalid sampler specified: {}".format(sampler))
+    return engines[sampler](d=num_var, seed=rng).random(nsamples)
+
+def estimates(analysis):
+    """Function to obtain the per sample estimates of the lower and upper
+    bound of pf: failure indicators or conditional probabilities."""
+    results = analysis.results.values()
+    if 'pf' in next(iter(results))['min']:                                     # directional, line
+        return np.array([[r['min']['pf'], r['max']['pf']] for r in results], dtype=float)
+    return np.array([[r['min']['y'] < 0, r['max']['y'] < 0] for r in results], dtype=float)
+
+def finite(value):
+    """Function to convert the value to float, or to None (null in JSON)
+    if it is not finite, e.g. beta for pf = 0."""
+    value = float(value)
+    return value if np.isfinite(value) else None
+
+def start_workers(queue, n, paths=()):
+    """Function to start n local worker processes on the work queue."""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(list(paths) + [p for p in sys.path if p])
+    return [subprocess.Popen([sys.executable, '-m', 'imprel.Batch', 'worker', queue], env=env)
+            for _ in range(n)]
+
+def run(config, paths=()):
+    """Function to run the analysis described by the config. Returns the
+    dictionary of results and metrics, non-finite values (beta for pf = 0
+    or 1, cov for pf = 0) are None."""
+    t = time.perf_counter()
+    variables = [get_variable(spec) for spec in config['variables']]
+    paths = list(paths) + [os.getcwd()]
+    obj_function = load_function(config['limit_state'], paths)
+    rng = np.random.default_rng(config['seed'])
+    kwargs = {'method': config['method'], 'args': config['args'], 'options': config['options'],
+              'direction': config['direction'], 'verbose': False, 'logger': logger}
+
+    queue, tmp, workers = config['queue'], None, []
+    if config['workers'] and queue is None:
+        tmp = tempfile.TemporaryDirectory()
+        queue = tmp.name
+    if config['workers']:
+        workers = start_workers(queue, config['workers'], paths)
+    if tmp is not None:                                                        # no other workers on the queue
+        kwargs['alive'] = lambda: any(w.poll() is None for w in workers)
+    shard_size = config['shard_size'] or max(1, config['nsamples'] // (4*max(1, config['workers'])))
+
+    metrics = Metrics()                                                        # timers of all batches
+    analyses, values = [], np.empty((0, 2))
+    try:
+        while True:
+            with metrics.timer('sampling'):
+                samples = get_samples(config['sampler'], config['nsamples'], len(variables), rng)
+            plan = Plan(variables, samples=samples, seed=rng.integers(2**32))
+            if queue is None:
+                res = plan.run(obj_function, **kwargs)
+            else:
+                res = QueueAnalysis(variables, obj_function, queue=queue, shard_size=shard_size,
+                                    plan=plan, **kwargs)
+            analyses.append(res)
+            for m in (plan.metrics, res.metrics):
+                for phase, t_phase in m.timers.items():
+                    metrics.timers[phase] = metrics.timers.get(phase, 0.) + t_phase
+            values = np.vstack([values, estimates(res)])
+
+            pf = values.mean(axis=0)
+            cov = np.where(pf > 0, values.std(axis=0) / len(values)**.5 / np.where(pf > 0, pf, 1.), np.inf)
+            logger.info('%d samples, pf = %s, cov = %s', len(values), pf, cov)
+            if config['cov'] is None or max(cov[pf > 0], default=np.inf) <= config['cov'] or \
+               len(values) + config['nsamples'] > config['max_samples']:
+                break
+    finally:
+        if workers:
+            WorkQueue(queue).stop()
+            for w in workers:
+                w.wait()
+        if tmp is not None:
+            tmp.cleanup()
+
+    return {
+        'limit_state': config['limit_state'],
+        'method': config['method'],
+        'sampler': config['sampler'],
+        'nsamples': len(values),
+        'batches': len(analyses),
+        'pf': [finite(p) for p in pf],
+        'b': [finite(get_reliability_index(p)) for p in pf],
+        'cov': [finite(c) for c in cov],
+        'time': time.perf_counter() - t,
+        'metrics': {
+            'timers': metrics.timers,
+            'nfev': sum(res.metrics.nfev for res in analyses),
+            'nit': sum(res.metrics.nit for res in analyses),
+            'failures': sum(res.metrics.failures for res in analyses)
+            }
+        }
+
+def main(argv=None):
+    """Function of the `imprel` command."""
+    parser = argparse.ArgumentParser(prog='imprel', description='Classic and Imprecise Structural Reliability Analysis.')
+    parser.add_argument('-v', '--verbose', action='store_true', help='log the progress to stderr')
+    commands = parser.add_subparsers(dest='command', required=True)
+    run_parser = commands.add_parser('run', help='run the analysis described by the config')
+    run_parser.add_argument('config', help='JSON config of the analysis')
+    run_parser.add_argument('-o', '--output', help='path of the JSON results')
+    run_parser.add_argument('-w', '--workers', type=int, help='number of local worker processes')
+    run_parser.add_argument('-s', '--seed', type=int, help='seed of the sampling')
+    worker_parser = commands.add_parser('worker', help='run the worker of the work queue')
+    worker_parser.add_argument('queue', help='directory of the work queue')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format='%(asctime)s %(levelname)s %(message)s')
+    if args.command == 'worker':
+        worker(args.queue)
+        return 0
+
+    config = load_config(args.config)
+    for key in ('output', 'workers', 'seed'):
+        if getattr(args, key) is not None:
+            config[key] = getattr(args, key)
+    results = run(config, paths=[os.path.dirname(os.path.abspath(args.config))])
+    results['config'] = config
+    directory = os.path.dirname(config['output'])
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(config['output'], 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, allow_nan=False)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,289 @@
+"""
+Implementation of the distributed execution of the Structural Reliability
+Analysis (Classic and Imprecise). The coordinator splits the samples from
+[0,1] into shards and puts them into a work queue in a shared directory,
+worker processes (on this or other hosts mounting the same directory)
+claim the shards, run the min/max searches and write the results back.
+
+The queue directory has the following layout:
+
+    job.pkl     the variables, objective function and its arguments
+    pending/    shards waiting for a worker, `<num>.pkl`
+    running/    claimed shards, `<num>.<worker>.pkl`, touched after each sample
+    done/       results of the shards, `<num>.pkl`
+    failed/     failure records, `<num>.<worker>.<time>.pkl`
+    stop        if present, the workers exit
+
+Shards are claimed by the atomic rename from `pending/` to `running/`.
+Shards of a failed or silent (no heartbeat within `timeout`) worker are
+moved back to `pending/` and reassigned. The workers are started by
+`imprel worker <dir>` (see `Batch`). The objective function has to be
+importable by the workers, i.e. defined at the module level.
+
+"""
+
+import numpy as np
+import os
+import time
+import pickle
+import socket
+#from Runer import Analysis, Plan                    # use this line for tests
+from . import *                                      # instead of this
+
+def _write(path, obj):
+    """Function to write the object to the .pkl file atomically."""
+    directory, name = os.path.split(path)
+    tmp = os.path.join(directory, f'.{name}.{os.getpid()}.tmp')
+    with open(tmp, 'wb') as f:
+        pickle.dump(obj, f)
+    os.replace(tmp, path)
+
+def _read(path):
+    """Function to read the object from the .pkl file."""
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+def _num(filename):
+    """Function to obtain the shard number from the file name."""
+    return int(filename.split('.', 1)[0])
+
+# class of work queue
+class WorkQueue:
+    """Class of the file-system work queue shared by the coordinator and
+    the workers. The directory `path` has to be visible to all hosts.
+
+    Example:
+    -------
+    queue = WorkQueue('/shared/queue', timeout=60.)
+    queue.submit(job, shards)                       # coordinator
+    results = queue.collect()
+    """
+    dirs = ('pending', 'running', 'done', 'failed')
+
+    def __init__(self, path, timeout=600., retries=3, poll=.1):
+        self.path = path
+        self.timeout = timeout
+        self.retries = retries
+        self.poll = poll
+        self.job = None
+        for d in self.dirs:
+            os.makedirs(os.path.join(path, d), exist_ok=True)
+
+    def dir(self, name):
+        return os.path.join(self.path, name)
+
+    def files(self, name):
+        """Function to list the shard files of the directory."""
+        return sorted(f for f in os.listdir(self.dir(name)) if not f.startswith('.'))
+
+    def submit(self, job: dict, shards: list):
+        """Function to clear the queue and to put the job and its shards."""
+        for d in self.dirs:
+            for f in os.listdir(self.dir(d)):
+                os.remove(os.path.join(self.dir(d), f))
+        if os.path.exists(self.dir('stop')):
+            os.remove(self.dir('stop'))
+        self.job = f'{socket.gethostname()}-{os.getpid()}-{time.time_ns()}'
+        self.nshards = len(shards)
+        _write(self.dir('job.pkl'), dict(job, id=self.job))
+        for num, shard in enumerate(shards):
+            _write(os.path.join(self.dir('pending'), f'{num}.pkl'), dict(shard, job=self.job))
+
+    def claim(self, worker_id):
+        """Function to claim a pending shard. Returns the path of the claimed
+        shard and the shard, or None if there is nothing to do."""
+        for f in self.files('pending'):
+            path = os.path.join(self.dir('running'), f'{_num(f)}.{worker_id}.pkl')
+            try:
+                os.rename(os.path.join(self.dir('pending'), f), path)
+            except FileNotFoundError:                                          # claimed by another worker
+                continue
+            os.utime(path)
+            return path, _read(path)
+        return None
+
+    def complete(self, path, result):
+        """Function to put the result of the claimed shard."""
+        _write(os.path.join(self.dir('done'), f'{_num(os.path.basename(path))}.pkl'), result)
+        try:
+            os.remove(path)
+        except FileNotFoundError:                                              # reassigned meanwhile
+            pass
+
+    def fail(self, path, message):
+        """Function to record the failure of the claimed shard and to put
+        it back to the pending shards."""
+        name = os.path.basename(path)
+        _write(os.path.join(self.dir('failed'), f'{name[:-4]}.{time.time_ns()}.pkl'), message)
+        try:
+            if os.path.exists(self.dir('job.pkl')):
+                os.rename(path, os.path.join(self.dir('pending'), f'{_num(name)}.pkl'))
+            else:                                                              # job was cancelled
+                os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def requeue(self):
+        """Function to put the shards of silent workers back to the pending
+        shards. Returns the number of reassigned shards."""
+        count = 0
+        for f in self.files('running'):
+            path = os.path.join(self.dir('running'), f)
+            try:
+                if time.time() - os.path.getmtime(path) > self.timeout:
+                    self.fail(path, f'No heartbeat within {self.timeout} s.')
+                    count += 1
+            except FileNotFoundError:                                          # finished meanwhile
+                pass
+        return count
+
+    def failures(self):
+        """Function to obtain the failure messages of every shard."""
+        failures = {}
+        for f in self.files('failed'):
+            failures.setdefault(_num(f), []).append(_read(os.path.join(self.dir('failed'), f)))
+        return failures
+
+    def collect(self, callback=None, alive=None):
+        """Function to wait for the results of all shards. The callback
+        receives the shard number and the result after each shard. If given,
+        `alive()` tells whether any worker is still running."""
+        results = {}
+        self.reassigned = 0
+        while len(results) < self.nshards:
+            for f in self.files('done'):
+                num = _num(f)
+                if num in results:
+                    continue
+                result = _read(os.path.join(self.dir('done'), f))
+                if result.get('job') != self.job:                              # stale result
+                    continue
+                results[num] = result
+                if callback is not None:
+                    callback(num, result)
+            self.reassigned += self.requeue()
+            for num, messages in self.failures().items():
+                if num not in results and len(messages) >= self.retries:
+                    self.cancel()
+                    raise ValueError(f"Shard {num} failed {len(messages)} times. {messages[-1]}")
+            if len(results) < self.nshards and alive is not None and not alive():
+                self.cancel()
+                raise ValueError(f"All workers have exited, {self.nshards - len(results)} shards are left.")
+            if len(results) < self.nshards:
+                time.sleep(self.poll)
+        return results
+
+    def cancel(self):
+        """Function to remove the job and its pending shards."""
+        try:
+            os.remove(self.dir('job.pkl'))
+        except FileNotFoundError:
+            pass
+        for f in self.files('pending'):
+            try:
+                os.remove(os.path.join(self.dir('pending'), f))
+            except FileNotFoundError:
+                pass
+
+    def stop(self):
+        """Function to ask the workers to exit."""
+        open(self.dir('stop'), 'w').close()
+
+
+def worker(path, worker_id=None, poll=.5, idle_timeout=None):
+    """Function to run the worker: claims the shards from the work queue in
+    `path` and runs the analysis of each until the queue is stopped (or no
+    shard came within `idle_timeout` seconds). Returns the number of shards."""
+    queue = WorkQueue(path)
+    worker_id = worker_id or f'{socket.gethostname()}-{os.getpid()}'
+    job = None
+    count = 0
+    idle = time.time()
+    while not os.path.exists(queue.dir('stop')):
+        claimed = queue.claim(worker_id)
+        if claimed is None:
+            if idle_timeout is not None and time.time() - idle > idle_timeout:
+                break
+            time.sleep(poll)
+            continue
+        running, shard = claimed
+        try:
+            if job is None or job['id'] != shard['job']:
+                job = _read(queue.dir('job.pkl'))
+            if job['id'] != shard['job']:                                      # shard of an old job
+                os.remove(running)
+                continue
+            variables = job['variables']
+            res = Analysis(variables, job['obj_function'], method=job['method'], args=job['args'],
+                           plan=Plan(variables, samples=shard['samples']), x0=shard['x0'],
+                           direction=job.get('direction'), options=job.get('options'), verbose=False,
+                           callback=lambda report: os.utime(running))
+        except Exception as e:
+            if os.path.exists(running):
+                queue.fail(running, f'{type(e).__name__}: {e}')
+            # otherwise the claim was revoked (requeued by the coordinator),
+            # the failure is already recorded and the shard is dropped
+        else:
+            queue.complete(running, {
+                'job': shard['job'],
+                'results': {num: r for num, r in zip(shard['nums'], res.results.values())},
+                'metrics': res.metrics.as_dict()
+                })
+            count += 1
+        idle = time.time()
+    return count
+
+
+# class of distributed analysis
+class QueueAnalysis(Analysis):
+    """Class of the analysis distributed through the work queue. The samples
+    are split into shards of `shard_size` which are run by the workers
+    (see `worker`) and merged into the usual `results` and `reliability`.
+    Shards of failed workers or workers without a heartbeat within `timeout`
+    seconds are reassigned, a shard failing `retries` times stops the run.
+    The run also stops when `alive()` (if given) reports no running workers.
+
+    Example:
+    -------
+    # on every host: imprel worker /shared/queue
+    res = QueueAnalysis(variables, obj_func, queue='/shared/queue',
+                        nsamples=1000000, shard_size=1000)
+    """
+    methods = {method: 'queue_analyse' for method in Analysis.methods}
+
+    def __init__(self, variables: list, obj_function: callable, queue, shard_size=100,
+                 timeout=600., retries=3, poll=.1, alive=None, **kwargs):
+        self.queue = WorkQueue(queue, timeout=timeout, retries=retries, poll=poll)
+        self.alive = alive
+        self.shard_size = shard_size
+        self.function = obj_function
+        super().__init__(variables, obj_function, **kwargs)
+
+    def queue_analyse(self, samples):
+        """Function for analysis on the workers of the queue."""
+        metrics = self.metrics
+        x0s = self.x0 if self.x0 is not None else (self.plan.x0 if self.plan is not None else None)
+        shards = []
+        for start in range(0, len(samples), self.shard_size):
+            sl = slice(start, start + self.shard_size)
+            shards.append({'nums': list(range(len(samples)))[sl],
+                           'samples': np.asarray(samples)[sl],
+                           'x0': None if x0s is None else (x0s[0][sl], x0s[1][sl])})
+        self.queue.submit({'variables': self.variables, 'obj_function': self.function,
+                           'method': self.method, 'args': self.args,
+                           'direction': self.direction, 'options': self.options}, shards)
+        self.log(f'Analysis of {len(samples)} samples has been submitted in {len(shards)} shards '
+                 f'to the work queue {self.queue.path}...')
+
+        done = []
+        def merge(num, result):
+            for n, rec in result['metrics']['samples'].items():
+                metrics.record(shards[num]['nums'][n], **rec)
+            metrics.nfev += result['metrics']['nfev']
+            done.append(num)
+            self.progress(sum(len(shards[n]['nums']) for n in done), len(samples))
+
+        with metrics.timer('optimization'):
+            results = self.queue.collect(callback=merge, alive=self.alive)
+        self.reassigned = self.queue.reassigned
+        return {num: r for shard in sorted(results) for num, r in results[shard]['results'].items()}
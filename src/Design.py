@@ -0,0 +1,159 @@
+"""
+Implementation of the Reliability-Based Design Optimization (RBDO) on top
+of the Structural Reliability Analysis (Classic and Imprecise). The outer
+samples are kept fixed in a plan, the inner min/max searches are
+warm-started from the previous design iterate and the sensitivities of
+pf/beta with respect to the design parameters are estimated with the
+smoothed indicator:
+
+    pf(d) ~ mean(Phi(-y(d)/eps)),
+    dpf/dd ~ -mean(phi(y(d)/eps)/eps * dy/dd),
+
+where y(d) is the lower (or upper) bound of the limit state for each
+sample. By the envelope theorem dy/dd is the partial derivative of the
+limit state at the minimizer (maximizer) found by the inner search, so it
+is obtained by finite differences without new searches.
+
+"""
+
+import numpy as np
+#from Runer import Analysis, Plan                    # use this line for tests
+from . import *                                      # instead of this
+
+# class of design optimization
+class DesignOptimization:
+    """Class for the reliability-based design optimization.
+    Requests the objective function `obj_function(x, d)` with the design
+    parameters `d`, and the cost function `cost(d)`. The cost is minimized
+    subject to beta(d) >= beta_target, where beta is taken from the 'lower'
+    (pessimistic, default) or 'upper' bound of the limit state.
+
+    The constraint uses the smoothed beta (see above), which differs from
+    the beta of the analysis (counting of the failed samples). Both are
+    reported: `b`, `pf` of the analysis and `b_smoothed`, `pf_smoothed`.
+
+    Example:
+    -------
+    def obj_func(x, d):
+        return d[0]*x[0]-x[1]
+
+    opt = DesignOptimization(variables, obj_func, cost=lambda d: d[0],
+                             beta_target=3., nsamples=2000, seed=1)
+    res = opt.optimize(d0=[1.5], bounds=[(.5, 3.)])
+    """
+    methods = ('scipy', 'multistart')                                         # y is the limit state
+
+    def __init__(self, variables: list, obj_function: callable, cost: callable, beta_target=3.,
+                 bound='lower', nsamples=1000, seed=None, plan=None, smoothing=None, step=1e-6,
+                 method='scipy', verbose=True, logger=None):
+        if not bound in ('lower', 'upper'):
+            raise ValueError("Invalid bound specified: {}".format(bound))
+        if not method in self.methods:
+            raise ValueError('Design optimization is supported for the scipy and multistart methods only.')
+        self.variables = variables
+        self.obj_function = obj_function
+        self.cost = cost
+        self.beta_target = beta_target
+        self.bound = bound
+        self.plan = plan if plan is not None else Plan(variables, nsamples=nsamples, seed=seed)
+        self.smoothing = smoothing
+        self.step = step
+        self.method = method
+        self.verbose = verbose
+        self.logger = logger
+        self.analyses = []
+        self.history = []
+        self._cache = {}
+
+    log = Analysis.log
+
+    @property
+    def nfev(self):
+        return sum(a.metrics.nfev for a in self.analyses) + sum(
+            rec['nfev'] for rec in self._cache.values())
+
+    def evaluate(self, d):
+        """Function to run the analysis of the design `d` on the plan,
+        warm-starting the min/max searches from the previous design."""
+        d = np.array(d, dtype=float)                                           # SLSQP reuses its array
+        x0 = None
+        if self.analyses:
+            results = self.analyses[-1].results.values()
+            x0 = (np.array([r['min']['x'] for r in results], dtype=float),
+                  np.array([r['max']['x'] for r in results], dtype=float))
+            if not np.isfinite(x0[1]).all():                                   # SRA case
+                x0 = None
+        res = self.plan.run(self.obj_function, method=self.method, args=(d,), x0=x0,
+                            verbose=False, logger=self.logger)
+        self.analyses.append(res)
+        return res
+
+    def sensitivity(self, d):
+        """Function to obtain the smoothed pf and beta of the design `d` with
+        their gradients with respect to the design parameters."""
+        import scipy.stats as stats
+        d = np.array(d, dtype=float)                                           # SLSQP reuses its array
+        key = tuple(d)
+        if key in self._cache:
+            return self._cache[key]
+
+        res = self.evaluate(d)
+        side = 'min' if self.bound == 'lower' else 'max'
+        xs = [r[side]['x'] for r in res.results.values()]
+        y = np.array([r[side]['y'] for r in res.results.values()], dtype=float)
+
+        # partial derivatives of the limit state at the minimizers (maximizers)
+        dy = np.zeros((len(y), len(d)))
+        for j in range(len(d)):
+            h = self.step * max(1., abs(d[j]))
+            dp, dm = d.copy(), d.copy()
+            dp[j] += h
+            dm[j] -= h
+            dy[:, j] = [(self.obj_function(x, dp) - self.obj_function(x, dm)) / (2*h) for x in xs]
+
+        eps = self.smoothing
+        if eps is None:                                                        # Silverman's rule
+            eps = 1.06 * np.std(y) * len(y)**(-1/5) if np.std(y) > 0 else 1.
+        pf_s = np.mean(stats.norm.cdf(-y/eps))
+        dpf = -np.mean(stats.norm.pdf(y/eps)[:, None] / eps * dy, axis=0)
+        pf_s = min(max(pf_s, 1e-16), 1 - 1e-16)
+        b = -stats.norm.ppf(pf_s)
+        db = -dpf / stats.norm.pdf(b)
+
+        self._cache[key] = {'d': d, 'pf': pf_s, 'b': b, 'dpf': dpf, 'db': db,
+                            'nfev': 2*len(d)*len(y), 'analysis': res}
+        return self._cache[key]
+
+    def optimize(self, d0, bounds=None, **options):
+        """Function to minimize the cost subject to the reliability constraint
+        smoothed beta(d) >= beta_target with SLSQP. Returns scipy OptimizeResult
+        with the analysis of the design and its `b`, `pf`, `b_smoothed`, `pf_smoothed`."""
+        from scipy.optimize import minimize
+
+        def constraint(d):
+            return self.sensitivity(d)['b'] - self.beta_target
+
+        def constraint_jac(d):
+            return self.sensitivity(d)['db']
+
+        side = 0 if self.bound == 'lower' else 1
+
+        def callback(d):
+            s = self.sensitivity(d)
+            a = s['analysis']
+            self.history.append({'d': s['d'], 'cost': self.cost(s['d']), 'pf': a.pf[side], 'b': a.b[side],
+                                 'pf_smoothed': s['pf'], 'b_smoothed': s['b']})
+            self.log(f'Iteration {len(self.history)}: d = {s["d"]}, cost = {self.cost(s["d"])}, '
+                     f'beta = {a.b[side]}, smoothed beta = {s["b"]}')
+
+        self.log('Reliability-Based Design Optimization (RBDO) has been started...')
+        res = minimize(self.cost, x0=np.asarray(d0, dtype=float), method='SLSQP', bounds=bounds,
+                       constraints=[{'type': 'ineq', 'fun': constraint, 'jac': constraint_jac}],
+                       callback=callback, options=options)
+        s = self.sensitivity(res.x)
+        res.analysis = s['analysis']
+        res.pf, res.b = res.analysis.pf[side], res.analysis.b[side]
+        res.pf_smoothed, res.b_smoothed = s['pf'], s['b']
+        self.log(f'Design:\n d    = {res.x} \n cost = {res.fun} \n beta = {res.b} '
+                 f'\n smoothed beta = {res.b_smoothed} (constraint)')
+        return res
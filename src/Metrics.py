@@ -0,0 +1,91 @@
+"""
+Implementation of the instrumentation for Structural Reliability Analysis
+(Classic and Imprecise). The metrics object collects per-phase timers,
+counts of objective evaluations, optimizer iterations and failures per
+sample, and reports progress with throughput and ETA.
+
+"""
+
+import time
+from contextlib import contextmanager
+
+class Metrics:
+    """Class for collecting metrics of the analysis.
+
+    Attributes:
+    ----------
+    timers   : wall time in seconds spent in each phase of the analysis
+               ('sampling', 'bounds', 'optimization', 'aggregation')
+    nfev     : total number of objective function evaluations
+    samples  : per sample counts {num: {'nfev': .., 'nit': .., 'failures': ..}}
+
+    Example:
+    -------
+    m = Metrics()
+    with m.timer('sampling'):
+        ...
+    m.as_dict()
+    """
+    phases = ('sampling', 'bounds', 'optimization', 'aggregation')
+
+    def __init__(self):
+        self.timers = {phase: 0. for phase in self.phases}
+        self.nfev = 0
+        self.samples = {}
+        self.start = time.perf_counter()
+
+    @contextmanager
+    def timer(self, phase):
+        """Context manager to accumulate the time spent in the phase."""
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timers[phase] = self.timers.get(phase, 0.) + time.perf_counter() - t
+
+    def count(self, func):
+        """Function to wrap the objective function so that every call
+        is counted in `nfev`."""
+        def counted(x, *args):
+            self.nfev += 1
+            return func(x, *args)
+        return counted
+
+    def record(self, num, nfev=0, nit=0, failures=0):
+        """Function to add the counts of the sample `num`."""
+        rec = self.samples.setdefault(num, {'nfev': 0, 'nit': 0, 'failures': 0})
+        rec['nfev'] += nfev
+        rec['nit'] += nit
+        rec['failures'] += failures
+
+    @property
+    def nit(self):
+        return sum(rec['nit'] for rec in self.samples.values())
+
+    @property
+    def failures(self):
+        return sum(rec['failures'] for rec in self.samples.values())
+
+    @property
+    def time(self):
+        return sum(self.timers.values())
+
+    def progress(self, done, total):
+        """Function to obtain the progress report with throughput
+        (samples per second) and estimated time to finish."""
+        elapsed = time.perf_counter() - self.start
+        rate = done / elapsed if elapsed > 0 else float('inf')
+        eta = (total - done) / rate if rate > 0 else float('inf')
+        return {'done': done, 'total': total, 'elapsed': elapsed,
+                'rate': rate, 'eta': eta}
+
+    def as_dict(self):
+        """Function to export the metrics as a plain dictionary."""
+        return {
+            'time': self.time,
+            'timers': dict(self.timers),
+            'nfev': self.nfev,
+            'nit': self.nit,
+            'failures': self.failures,
+            'samples': {num: dict(rec) for num, rec in self.samples.items()}
+        }
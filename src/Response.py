@@ -0,0 +1,73 @@
+"""
+Implementation of the response distribution for Structural Reliability
+Analysis (Classic and Imprecise). The lower and upper bounds of the limit
+state (`ymin`, `ymax` of the analysis) are sorted once, then the bounds of
+the CDF (p-box), the quantiles and pf at any thresholds are obtained by
+binary search.
+
+"""
+
+import numpy as np
+
+# class of response distribution
+class Response:
+    """Class of the response distribution. Requests the lower `ymin` and the
+    upper `ymax` bounds of the limit state for every sample (only `ymin` in
+    the Classic case). All queries accept arrays and return the tuple of
+    values for the lower and upper bound of the limit state, i.e. the upper
+    and lower bound of the CDF and pf, as `Analysis.pf`.
+
+    Example:
+    -------
+    resp = Response(res.ymin, res.ymax)                 # or res.response()
+    resp.pf([-.1, 0., .1])
+    resp.quantile(.05)
+    resp = resp.merge(res2.response())
+    """
+    def __init__(self, ymin, ymax=None, presorted=False):
+        self.ymin = np.asarray(ymin, dtype=float)
+        self.ymax = self.ymin if ymax is None else np.asarray(ymax, dtype=float)
+        if not presorted:
+            self.ymin = np.sort(self.ymin)
+            self.ymax = self.ymin if ymax is None else np.sort(self.ymax)
+        if len(self.ymin) != len(self.ymax):
+            raise ValueError('Provide the bounds of the limit state for the same samples.')
+        self.nsamples = len(self.ymin)
+
+    @property
+    def imprecise(self):
+        return self.ymax is not self.ymin
+
+    def cdf(self, y):
+        """Function to obtain the CDF values P(Y <= y) for the lower and upper
+        bound of the limit state."""
+        return (np.searchsorted(self.ymin, y, side='right') / self.nsamples,
+                np.searchsorted(self.ymax, y, side='right') / self.nsamples)
+
+    def pf(self, threshold=0.):
+        """Function to obtain the probability of failure P(Y < threshold) for
+        the lower and upper bound of the limit state."""
+        return (np.searchsorted(self.ymin, threshold, side='left') / self.nsamples,
+                np.searchsorted(self.ymax, threshold, side='left') / self.nsamples)
+
+    def quantile(self, p):
+        """Function to obtain the quantiles (inverse of the empirical CDF)
+        of the lower and upper bound of the limit state."""
+        p = np.asarray(p, dtype=float)
+        if (p < 0).any() or (p > 1).any():
+            raise ValueError('Probability value is out of bounds [0,1].')
+        idx = np.clip(np.ceil(p * self.nsamples).astype(int) - 1, 0, self.nsamples - 1)
+        return self.ymin[idx], self.ymax[idx]
+
+    def merge(self, *others):
+        """Function to merge the responses of several runs. The sorted data
+        are merged by insertion, without sorting everything again."""
+        def insert(a, b):
+            return np.insert(a, np.searchsorted(a, b), b)
+        imprecise = self.imprecise or any(other.imprecise for other in others)
+        ymin, ymax = self.ymin, self.ymax
+        for other in others:
+            if imprecise:
+                ymax = insert(ymax, other.ymax)
+            ymin = insert(ymin, other.ymin)
+        return Response(ymin, ymax if imprecise else None, presorted=True)
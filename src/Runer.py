@@ -10,37 +10,147 @@ based on the following resources:
     p-boxes using multi-level meta-models. Probabilistic Engineering
     Mechanics, 48, 27-38.`
 
+    `Koutsourelakis, P. S., Pradlwarter, H. J., & Schuëller, G. I. (2004).
+    Reliability of structures in high dimensions, part I: algorithms and
+    applications. Probabilistic Engineering Mechanics, 19(4), 409-417.`
+
 """
 
 import numpy as np
 import time
 import os
 import pickle
-from scipy.optimize import minimize
 #from utils import pf, get_reliability_index         # use this line for tests
+#from Metrics import Metrics                         # use this line for tests
+#from Response import Response                       # use this line for tests
 from . import *                                      # instead of this 
 
+def get_bounds(variables, samples):
+    """Function to evaluate the bounds of every variable for every sample
+    from [0,1]. Returns an array of shape (nsamples, num_var, 2)."""
+    return np.array([[v.get_bounds(sample0) for v, sample0 in zip(variables, sample)]
+                     for sample in samples], dtype=float).reshape(len(samples), len(variables), 2)
+
+def find_root(func, a, b, fa=None):
+    """Function to find the root of `func` on [a, b] by Brent's method.
+    Returns the root (None if the signs at the ends are equal) and the
+    values of `func` at the ends."""
+    from scipy.optimize import brentq
+    fa = func(a) if fa is None else fa
+    fb = func(b)
+    if np.sign(fa) == np.sign(fb):
+        return None, fa, fb
+    return brentq(func, a, b, xtol=1e-6), fa, fb
+
+def is_imprecise(variables):
+    """Function to check whether Pbox or Interval variables appear, i.e.
+    whether the Imprecise Structural Reliability Analysis (ISRA) is needed."""
+    t = ''
+    for var in variables:
+        t += str(type(var))
+    return ('Pbox' in t) or ('Interval' in t)
+
 # class of analysis
 class Analysis:
+    """Class of the analysis.
+
+    Optional hooks:
+    -------
+    verbose  : print the progress messages and results (quiet mode if False)
+    callback : callable receiving the progress report dictionary
+               {'done', 'total', 'elapsed', 'rate', 'eta'} after each sample
+    logger   : logging.Logger receiving the messages, results and progress
+
+    Extra arguments `args` are passed to the objective function as
+    `obj_function(x, *args)`, e.g. design parameters. With a `plan`
+    (see `Plan`) the samples, bounds and starting points of the plan are
+    reused instead of being drawn and evaluated again. The starting points
+    of the min/max searches can be given as `x0=(x0_min, x0_max)`, arrays of
+    shape (nsamples, num_var), e.g. to warm-start from a previous analysis.
+    
+    Methods:
+    -------
+    scipy       : crude Monte Carlo, pf from counting of the failed samples
+    multistart  : crude Monte Carlo with the robust search of the bounds, the
+                  candidate points (vertices of the box of the sample and a
+                  Latin hypercube) are screened (in one call if the option
+                  'vectorized' is set for elementwise functions) and
+                  SLSQP refines the best `nstarts` of them (at least
+                  `radius` of the box apart). Samples where no
+                  search converged keep the best point found and are
+                  counted in `metrics.failures` instead of stopping the run
+    directional : directional sampling, the samples give the directions
+                  in the standard normal space, pf from the root of the
+                  limit state along every direction
+    line        : line sampling, the samples give the lines parallel to the
+                  important `direction` in the standard normal space (the
+                  gradient of the limit state at the origin by default)
+
+    In the imprecise case the roots are searched on the lower and upper
+    envelopes of the limit state. The directional and line sampling assume
+    one root along every direction (line); `y` of the results is the
+    distance to the root and `cov` the coefficient of variation of pf.
+    The method `options` are passed as a dictionary, e.g.
+    {'nstarts': 2, 'radius': .25, 'ncandidates': 16, 'max_vertices': 64,
+     'vectorized': False} for multistart.
+    
+    The collected timers and counters are available in `metrics`.
+    """
     methods = {
-        'scipy': 'scipy_analyse'
+        'scipy': 'scipy_analyse',
+        'multistart': 'multistart_analyse',
+        'directional': 'directional_analyse',
+        'line': 'line_analyse'
         }
 
-    def __init__(self, variables: list, obj_function: callable, method='scipy', nsamples=10):
+    def __init__(self, variables: list, obj_function: callable, method='scipy', nsamples=10,
+                 verbose=True, callback=None, logger=None, args=(), plan=None, x0=None,
+                 direction=None, options=None):
         if not method in self.methods:
             raise ValueError("Invalid method specified: {}".format(method))
         self.method = method
-        self.nsamples = nsamples
         self.variables = variables
-        self.obj_function = obj_function
+        self.verbose = verbose
+        self.callback = callback
+        self.logger = logger
+        self.args = tuple(args)
+        self.plan = plan
+        self.x0 = x0
+        self.direction = direction
+        self.options = dict(options or {})
+        self.metrics = Metrics()
+        self.obj_function = self.metrics.count(obj_function)
 
-        t = time.time()
-        self.samples = self.sampling(nsamples)
+        if plan is None:
+            self.nsamples = nsamples
+            with self.metrics.timer('sampling'):
+                self.samples = self.sampling(nsamples)
+        else:
+            self.nsamples = plan.nsamples
+            self.samples = plan.samples
         self.results = getattr(self, self.methods[method])(self.samples)
-        t = round(time.time()-t)
-        self.time = t
-        print(f'Time spent: {t} s')
-        self.print_results()
+        with self.metrics.timer('aggregation'):
+            self.print_results()
+        self.time = self.metrics.time
+        self.log(f'Time spent: {self.time:.3f} s')
+
+    def log(self, message):
+        """Function to pass the message to stdout and the logger."""
+        if self.verbose:
+            print(message)
+        if self.logger is not None:
+            self.logger.info(message)
+
+    def progress(self, done, total):
+        """Function to report the progress to the callback and the logger."""
+        if self.callback is None and self.logger is None:
+            return
+        report = self.metrics.progress(done, total)
+        if self.callback is not None:
+            self.callback(report)
+        if self.logger is not None:
+            self.logger.debug('%(done)d/%(total)d samples, %(rate).1f samples/s, '
+                              'ETA %(eta).1f s', report)
 
     def sampling(self, nsamples):
         """Function to generate nsamples from [0,1]."""
@@ -52,44 +162,251 @@ class Analysis:
         In the case of appearence of Pbox or Interval variables
         the Imprecise Structural Reliability Analysis (ISRA) is held,
         otherwise Structural Reliability Analysis (SRA) is utilized."""
+        from scipy.optimize import minimize
         results = {}
         variables = self.variables
-        t = ''
-        for var in variables:
-            t += str(type(var))
-
-        if (('Pbox' in t) or ('Interval' in t)):
-            print('Imprecise Structural Reliability Analysis (ISRA) has been started...')
-            for num, sample in enumerate(samples):
-                bounds = [v.get_bounds(sample0) for v,sample0 in zip(variables,sample)]
-                
-                # Searching for min value
-                x0 = tuple([np.random.uniform(var_bound[0],var_bound[1]) for var_bound in bounds])
-                res_min = minimize(self.obj_function, x0=x0, bounds=bounds, method='SLSQP')
-                if not res_min.success:
-                    raise ValueError(f"Could not find lower bound. {res_min.message}")
-
-                # Searching for max value
-                x0 = tuple([np.random.uniform(var_bound[0],var_bound[1]) for var_bound in bounds])
-                res_max = minimize(lambda x: -self.obj_function(x), x0=x0, bounds=bounds, method='SLSQP')
-                if not res_max.success:
-                    raise ValueError(f"Could not find upper bound. {res_max.message}")
-                    
-                results[num] = {'min': {'y': res_min.fun, 'x': res_min.x}, 'max': {'y': -res_max.fun, 'x': res_max.x}}
+        metrics = self.metrics
+        args = self.args
+
+        if self.plan is not None:
+            bounds, x0s = self.plan.bounds, self.plan.x0
+        else:
+            with metrics.timer('bounds'):
+                bounds = get_bounds(variables, samples)
+            x0s = None
+        if self.x0 is not None:
+            x0s = self.x0
+
+        if is_imprecise(variables):
+            self.log('Imprecise Structural Reliability Analysis (ISRA) has been started...')
+            with metrics.timer('optimization'):
+                for num, sample_bounds in enumerate(bounds):
+                    nfev = metrics.nfev
+
+                    # Searching for min value
+                    if x0s is None:
+                        x0 = tuple([np.random.uniform(var_bound[0],var_bound[1]) for var_bound in sample_bounds])
+                    else:
+                        x0 = x0s[0][num]
+                    res_min = minimize(self.obj_function, x0=x0, args=args, bounds=sample_bounds, method='SLSQP')
+                    if not res_min.success:
+                        metrics.record(num, nfev=metrics.nfev-nfev, nit=res_min.nit, failures=1)
+                        raise ValueError(f"Could not find lower bound. {res_min.message}")
+
+                    # Searching for max value
+                    if x0s is None:
+                        x0 = tuple([np.random.uniform(var_bound[0],var_bound[1]) for var_bound in sample_bounds])
+                    else:
+                        x0 = x0s[1][num]
+                    res_max = minimize(lambda x, *args: -self.obj_function(x, *args), x0=x0, args=args,
+                                       bounds=sample_bounds, method='SLSQP')
+                    if not res_max.success:
+                        metrics.record(num, nfev=metrics.nfev-nfev, nit=res_min.nit+res_max.nit, failures=1)
+                        raise ValueError(f"Could not find upper bound. {res_max.message}")
+
+                    metrics.record(num, nfev=metrics.nfev-nfev, nit=res_min.nit+res_max.nit)
+                    results[num] = {'min': {'y': res_min.fun, 'x': res_min.x}, 'max': {'y': -res_max.fun, 'x': res_max.x}}
+                    self.progress(num+1, len(bounds))
 
         else:
-            print('Structural Reliability Analysis (SRA) has been started...!')
-            xs = [[v.get_bounds(s)[0] for v, s in zip(variables, sample)] for sample in samples]
-            ys = [*map(self.obj_function, xs)]
-            results = {num: {"min": {"y":y, "x":x}, 'max': {'y': np.inf, 'x': np.inf}} for num, (x, y) in enumerate(zip(xs, ys))}
+            self.log('Structural Reliability Analysis (SRA) has been started...!')
+            with metrics.timer('optimization'):
+                for num, sample_bounds in enumerate(bounds):
+                    x = [var_bound[0] for var_bound in sample_bounds]
+                    y = self.obj_function(x, *args)
+                    metrics.record(num, nfev=1)
+                    results[num] = {"min": {"y":y, "x":x}, 'max': {'y': np.inf, 'x': np.inf}}
+                    self.progress(num+1, len(bounds))
         
         return results
 
+    def screen(self, X):
+        """Function to evaluate the objective function at the candidate points
+        `X` of shape (ncand, num_var). With the option 'vectorized' the function
+        is called once with the array of shape (num_var, ncand), so it has to
+        be elementwise (e.g. x[0]-x[1]), otherwise point by point."""
+        if not self.options.get('vectorized', False):
+            return np.array([self.obj_function(x, *self.args) for x in X], dtype=float)
+        with np.errstate(all='ignore'):
+            y = np.asarray(self.obj_function(X.T, *self.args), dtype=float)
+        if y.shape != (len(X),):
+            raise ValueError(f'Vectorized objective function returned shape {y.shape} '
+                             f'instead of ({len(X)},).')
+        self.metrics.nfev += len(X) - 1
+        return y
+
+    def candidates(self, sample_bounds, x0s=()):
+        """Function to generate the candidate points in the box of the sample:
+        the vertices (random `max_vertices` of them in high dimensions), the
+        Latin hypercube of `ncandidates` points and the starting points `x0s`."""
+        ncand = self.options.get('ncandidates', 16)
+        max_vertices = self.options.get('max_vertices', 64)
+        lb, ub = sample_bounds[:, 0], sample_bounds[:, 1]
+        free = np.flatnonzero(ub > lb)
+        if 2**len(free) <= max_vertices:
+            corners = (np.arange(2**len(free))[:, None] >> np.arange(len(free))) & 1
+        else:
+            corners = np.random.randint(2, size=(max_vertices, len(free)))
+        vertices = np.tile(lb, (len(corners), 1))
+        vertices[:, free] = np.where(corners, ub[free], lb[free])
+        lhs = (np.argsort(np.random.uniform(size=(len(lb), ncand)), axis=1).T
+               + np.random.uniform(size=(ncand, len(lb)))) / ncand
+        return np.vstack([vertices, lb + lhs*(ub - lb)] + [np.atleast_2d(x0) for x0 in x0s])
+
+    def multistart_analyse(self, samples):
+        """Function for analysis with the robust multi-start search of the bounds.
+        Structural Reliability Analysis (SRA) is the same as for scipy."""
+        from scipy.optimize import minimize
+        if not is_imprecise(self.variables):
+            return self.scipy_analyse(samples)
+        results = {}
+        metrics = self.metrics
+        args = self.args
+        nstarts = self.options.get('nstarts', 2)
+        radius = self.options.get('radius', .25)
+
+        if self.plan is not None:
+            bounds = self.plan.bounds
+        else:
+            with metrics.timer('bounds'):
+                bounds = get_bounds(self.variables, samples)
+        x0s = self.x0 if self.x0 is not None else (self.plan.x0 if self.plan is not None else None)
+
+        self.log('Imprecise Structural Reliability Analysis (ISRA) with multi-start search has been started...')
+        with metrics.timer('optimization'):
+            for num, sample_bounds in enumerate(bounds):
+                nfev, nit, failures = metrics.nfev, 0, 0
+                X = self.candidates(sample_bounds, () if x0s is None else (x0s[0][num], x0s[1][num]))
+                y = self.screen(X)
+                results[num] = {}
+                scale = np.where(sample_bounds[:, 1] > sample_bounds[:, 0],
+                                 sample_bounds[:, 1] - sample_bounds[:, 0], 1.)
+                for side, sign in (('min', 1.), ('max', -1.)):
+                    order = np.argsort(sign*y)
+                    best = {'y': y[order[0]], 'x': X[order[0]]}
+                    success = False
+                    starts = []
+                    for i in order:                                            # best distinct candidates
+                        if all(np.abs((X[i] - X[j]) / scale).max() > radius for j in starts):
+                            starts.append(i)
+                        if len(starts) == nstarts:
+                            break
+                    for i in starts:
+                        res = minimize(lambda x, *args: sign*self.obj_function(x, *args), x0=X[i],
+                                       args=args, bounds=sample_bounds, method='SLSQP')
+                        nit += res.nit
+                        if res.success:
+                            success = True
+                            if res.fun < sign*best['y']:
+                                best = {'y': sign*res.fun, 'x': res.x}
+                    failures += not success
+                    best['y'] = self.obj_function(best['x'], *args)           # point by point
+                    results[num][side] = best
+                metrics.record(num, nfev=metrics.nfev-nfev, nit=nit, failures=failures)
+                self.progress(num+1, len(bounds))
+
+        if metrics.failures:
+            self.log(f'Search did not converge {metrics.failures} times, the best points found are kept.')
+        return results
+
+    def envelope(self, z, side='min'):
+        """Function to evaluate the lower ('min') or upper ('max') envelope of
+        the limit state at the point `z` of the standard normal space."""
+        import scipy.stats as stats
+        from scipy.optimize import minimize
+        u = np.clip(stats.norm.cdf(z), 1e-16, 1 - 1e-16)
+        bounds = get_bounds(self.variables, [u])[0]
+        if not is_imprecise(self.variables):
+            return self.obj_function(bounds[:, 0], *self.args)
+        sign = 1. if side == 'min' else -1.
+        res = minimize(lambda x, *args: sign*self.obj_function(x, *args), x0=bounds.mean(axis=1),
+                       args=self.args, bounds=bounds, method='SLSQP')
+        if not res.success:
+            raise ValueError(f"Could not find {'lower' if side == 'min' else 'upper'} bound. {res.message}")
+        self._nit += res.nit
+        return sign*res.fun
+
+    def important_direction(self, side='min', step=1e-3):
+        """Function to obtain the important direction (unit vector pointing
+        to the failure domain) of the envelope for the line sampling."""
+        if self.direction is not None:
+            alpha = np.asarray(self.direction, dtype=float)
+        else:
+            num_var = len(self.variables)
+            alpha = -np.array([(self.envelope(step*e, side) - self.envelope(-step*e, side)) / (2*step)
+                               for e in np.eye(num_var)])
+        if not np.linalg.norm(alpha) > 0:
+            raise ValueError('Could not find the important direction. Provide `direction`.')
+        return alpha / np.linalg.norm(alpha)
+
+    def sampling_analyse(self, samples, line):
+        """Function for the directional (line=False) and line (line=True)
+        sampling analysis."""
+        import scipy.stats as stats
+        results = {}
+        metrics = self.metrics
+        num_var = len(self.variables)
+        sides = ('min', 'max') if is_imprecise(self.variables) else ('min',)
+        z = stats.norm.ppf(np.clip(samples, 1e-16, 1 - 1e-16))
+        length = stats.chi2.isf(1e-16, num_var)**.5                           # beyond pf ~ 1e-16
+        self._nit = 0
+
+        name = 'Line' if line else 'Directional'
+        if len(sides) == 2:
+            self.log(f'Imprecise Structural Reliability Analysis (ISRA) with {name} sampling has been started...')
+        else:
+            self.log(f'Structural Reliability Analysis (SRA) with {name} sampling has been started...!')
+        with metrics.timer('optimization'):
+            if line:
+                alphas = {side: self.important_direction(side) for side in sides}
+            else:
+                g0 = {side: self.envelope(np.zeros(num_var), side) for side in sides}
+            for num, z0 in enumerate(z):
+                nfev, nit = metrics.nfev, self._nit
+                results[num] = {'max': {'y': np.inf, 'z': np.inf, 'pf': 0.}}
+                for side in sides:
+                    if line:
+                        alpha = alphas[side]
+                        zp = z0 - (z0 @ alpha)*alpha
+                        c, fa, fb = find_root(lambda c: self.envelope(zp + c*alpha, side), -length, length)
+                        if c is None:
+                            p = float(fb < 0)
+                        else:
+                            p = stats.norm.cdf(-c) if fb < 0 else stats.norm.cdf(c)
+                        results[num][side] = {'y': c, 'z': None if c is None else zp + c*alpha, 'pf': p}
+                    else:
+                        a = z0 / np.linalg.norm(z0)
+                        r, fa, fb = find_root(lambda r: self.envelope(r*a, side), 0., length, fa=g0[side])
+                        if r is None:
+                            p = float(fb < 0)
+                        else:
+                            p = stats.chi2.sf(r**2, num_var) if fb < 0 else stats.chi2.cdf(r**2, num_var)
+                        results[num][side] = {'y': r, 'z': None if r is None else r*a, 'pf': p}
+                metrics.record(num, nfev=metrics.nfev-nfev, nit=self._nit-nit)
+                self.progress(num+1, len(z))
+
+        return results
+
+    def directional_analyse(self, samples):
+        """Function for the directional sampling analysis."""
+        return self.sampling_analyse(samples, line=False)
+
+    def line_analyse(self, samples):
+        """Function for the line sampling analysis."""
+        return self.sampling_analyse(samples, line=True)
+
     def print_results(self):
         """Function to print the results."""
         self.ymin = [num['min']['y'] for num in self.results.values()]
         self.ymax = [num['max']['y'] for num in self.results.values()]
-        self.pf = (pf(self.ymin), pf(self.ymax))
+        if 'pf' in next(iter(self.results.values()))['min']:                  # directional, line
+            pfs = np.array([[num['min']['pf'], num['max']['pf']] for num in self.results.values()])
+            self.pf = tuple(pfs.mean(axis=0))
+            pf_mean = np.array(self.pf)
+            self.cov = tuple(np.where(pf_mean > 0, pfs.std(axis=0) / len(pfs)**.5
+                                      / np.where(pf_mean > 0, pf_mean, 1.), np.inf))        # no estimate for pf = 0
+        else:
+            self.pf = (pf(self.ymin), pf(self.ymax))
         self.b = (get_reliability_index(self.pf[0]),
                   get_reliability_index(self.pf[1]))
         self.reliability = {
@@ -104,8 +421,17 @@ class Analysis:
                 'b': self.b[1]
             }
         }
-        print('Lower:\n pf   =', self.pf[0], '\n beta =', self.b[0])
-        print('Upper:\n pf   =', self.pf[1], '\n beta =', self.b[1])
+        self.log(f'Lower:\n pf   = {self.pf[0]} \n beta = {self.b[0]}')
+        self.log(f'Upper:\n pf   = {self.pf[1]} \n beta = {self.b[1]}')
+
+    def response(self):
+        """Function to obtain the response distribution (see `Response`)
+        from the bounds of the limit state."""
+        if 'pf' in next(iter(self.results.values()))['min']:
+            raise ValueError('Response is available for the scipy method only.')
+        if not is_imprecise(self.variables):
+            return Response(self.ymin)
+        return Response(self.ymin, self.ymax)
 
     def save_to_file(self, filename):
         """Function to save results of the analysis to the .pkl file."""
@@ -119,8 +445,114 @@ class Analysis:
                 'method': self.method,
                 'nsamples': self.nsamples,
                 'time': self.time,
+                'metrics': self.metrics.as_dict(),
                 'pf': self.pf,
                 'b': self.b,
                 'variables': [{k: v for k, v in var.__dict__.items() if k != '_func'} for var in self.variables],
                 'results': self.results
-            }, f)
\ No newline at end of file
+            }, f)
+
+# class of analysis plan
+class Plan:
+    """Class of the analysis plan. The samples from [0,1], the bounds of the
+    variables and the starting points of the searches are drawn and evaluated
+    once, and then reused by every run of the plan. All runs therefore share
+    common random numbers, which gives low-variance comparisons of designs.
+
+    Example:
+    -------
+    plan = Plan(variables, nsamples=10000, seed=1)
+    res1 = plan.run(obj_func, args=(d1,))
+    res2 = plan.run(obj_func, args=(d2,))
+    res = plan.run_system([obj_func1, obj_func2], kind='series')
+    """
+    def __init__(self, variables: list, nsamples=10, samples=None, seed=None):
+        self.variables = variables
+        self.imprecise = is_imprecise(variables)
+        self.metrics = Metrics()
+        rng = np.random.default_rng(seed)
+
+        with self.metrics.timer('sampling'):
+            if samples is None:
+                samples = rng.uniform(size=(nsamples, len(variables)))
+            self.samples = np.asarray(samples, dtype=float)
+        self.nsamples = len(self.samples)
+
+        with self.metrics.timer('bounds'):
+            self.bounds = get_bounds(variables, self.samples)
+            lb, ub = self.bounds[..., 0], self.bounds[..., 1]
+            self.x0 = (rng.uniform(lb, ub), rng.uniform(lb, ub))
+
+    def run(self, obj_function: callable, method='scipy', args=(), **kwargs):
+        """Function to run the analysis of the objective function on the plan."""
+        return Analysis(self.variables, obj_function, method=method, args=args,
+                        plan=self, **kwargs)
+
+    def run_many(self, obj_function: callable, args_list: list, method='scipy', **kwargs):
+        """Function to run the analysis of the objective function for every
+        set of extra arguments (e.g. design parameters) in `args_list`."""
+        return [self.run(obj_function, method=method, args=args, **kwargs)
+                for args in args_list]
+
+    def run_system(self, obj_functions: list, kind='series', method='scipy', args=(), **kwargs):
+        """Function to run the analyses of several limit states on the plan
+        and to combine them into the series or parallel system."""
+        verbose = kwargs.pop('verbose', True)
+        logger = kwargs.get('logger')
+        analyses = [self.run(func, method=method, args=args, verbose=False, **kwargs)
+                    for func in obj_functions]
+        return SystemAnalysis(analyses, kind=kind, verbose=verbose, logger=logger)
+
+
+# class of system analysis
+class SystemAnalysis(Analysis):
+    """Class of the system analysis. Combines the analyses of several limit
+    states run on the same samples into the series (the system fails if any
+    component fails, g = min g_i) or parallel (the system fails if all
+    components fail, g = max g_i) system.
+
+    In the imprecise case the bounds are combined sample by sample. One side
+    of the combined bounds is exact and the other one encloses the exact
+    bound, so the pf bounds of the system are never too narrow.
+    """
+    kinds = {
+        'series': min,
+        'parallel': max
+        }
+
+    def __init__(self, analyses: list, kind='series', verbose=True, logger=None):
+        if not kind in self.kinds:
+            raise ValueError("Invalid system kind specified: {}".format(kind))
+        if any(a.method not in ('scipy', 'multistart') for a in analyses):
+            raise ValueError('Systems are supported for the scipy and multistart methods only.')
+        if len({a.nsamples for a in analyses}) != 1:
+            raise ValueError('Analyses of the system must have the same samples.')
+        self.analyses = analyses
+        self.kind = kind
+        self.method = analyses[0].method
+        self.nsamples = analyses[0].nsamples
+        self.variables = analyses[0].variables
+        self.samples = analyses[0].samples
+        self.plan = analyses[0].plan
+        self.verbose = verbose
+        self.callback = None
+        self.logger = logger
+        self.metrics = Metrics()
+        for a in analyses:
+            for phase, t in a.metrics.timers.items():
+                self.metrics.timers[phase] += t
+            self.metrics.nfev += a.metrics.nfev
+            for num, rec in a.metrics.samples.items():
+                self.metrics.record(num, **rec)
+
+        combine = self.kinds[kind]
+        with self.metrics.timer('aggregation'):
+            self.results = {num: {
+                'min': {'y': combine(a.results[num]['min']['y'] for a in analyses),
+                        'x': [a.results[num]['min']['x'] for a in analyses]},
+                'max': {'y': combine(a.results[num]['max']['y'] for a in analyses),
+                        'x': [a.results[num]['max']['x'] for a in analyses]}}
+                for num in analyses[0].results}
+            self.log(f'System ({kind}) of {len(analyses)} limit states:')
+            self.print_results()
+        self.time = self.metrics.time
@@ -6,7 +6,6 @@ Interval, Cdf, Pbox, Hist.
 """
 
 import abc
-from scipy.interpolate import interp1d
 #from utils import calculate_cdf         # use this line for tests
 from . import *                          # instead of this
 
@@ -113,6 +112,7 @@ class Hist(BaseVariable):
     def __init__(self, name: str, hist: list):
         self.name = name
         self.hist = hist
+        from scipy.interpolate import interp1d
         self.sorted_data, self.cdf_values = calculate_cdf(self.hist)
         self.inv_cdf = interp1d(self.cdf_values, self.sorted_data, bounds_error=False, 
                                     fill_value=(self.sorted_data[0], self.sorted_data[-1]))
@@ -1,8 +1,12 @@
 
 from __future__ import division, print_function, absolute_import
 from .utils import *
+from .Metrics import *
+from .Response import *
 from .Variables import *
 from .Runer import *
+from .Design import *
+from .Cluster import *
 
 
 __version__ = "0.0.1"
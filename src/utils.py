@@ -3,9 +3,10 @@ Implementation of some useful functions in process of
 Structural Reliability Analysis.
 """
 
-import matplotlib.pyplot as plt
 import numpy as np
-import scipy.stats as stats
+
+# scipy.stats and matplotlib.pyplot are imported inside the functions
+# which need them, so that `import imprel` stays cheap.
 
 def get_lognorm_param(m,s):
     """Function to obtain parameters of lognormal distribution."""
@@ -34,6 +35,7 @@ def get_reliability_index(pf):
     elif pf==1:
         return -np.inf
     else:
+        import scipy.stats as stats
         return stats.norm.ppf(1.0 - pf, loc=0., scale=1.)
 
 def get_probability_of_failure(ri):
@@ -41,18 +43,26 @@ def get_probability_of_failure(ri):
     Function to calculate probability of failure corresponding
     to given reliability index.
     """
+    import scipy.stats as stats
     return 1.0 - stats.norm.cdf(ri, loc=0., scale=1.)
    
 # There are two ways defined to obtain CDF from the array of values.
     
 def get_cdf(data, pplot=True):
     """There are two ways defined to obtain CDF from the array of values:
-    get_cdf() and calculate_cdf()."""
-    bins = np.linspace(-3, 3, 100)
-    count, bins_count = np.histogram(data, bins=bins)
-    pdf = count / sum(count)
+    get_cdf() and calculate_cdf(). The bins span the range of the finite
+    data, e.g. the infinite upper bounds of the SRA are left out."""
+    finite = np.asarray(data, dtype=float)
+    finite = finite[np.isfinite(finite)]
+    lb, ub = (finite.min(), finite.max()) if len(finite) else (-3., 3.)
+    if lb == ub:
+        lb, ub = lb - 1., ub + 1.
+    bins = np.linspace(lb, ub, 100)
+    count, bins_count = np.histogram(finite, bins=bins)
+    pdf = count / max(sum(count), 1)
     cdf = np.cumsum(pdf)
     if pplot==True:
+        import matplotlib.pyplot as plt
         plt.plot(bins[1:], cdf)
     return cdf, bins[1:]
 
@@ -0,0 +1,146 @@
+"""
+Unittests for file Batch.py.
+
+"""
+
+import unittest
+import os
+import sys
+import json
+import tempfile
+import threading
+import subprocess
+from unittest import mock
+import numpy as np
+import Batch
+import Cluster
+import Variables
+
+LIMIT_STATE = """
+def g(x, d=0.):
+    return x[0]-x[1]-d
+"""
+
+def get_config(**kwargs):
+    return dict({
+        'variables': [
+            {'type': 'p', 'name': 'r', 'dist': 'norm', 'params': [[.9, .14], [1., .14]]},
+            {'type': 'c', 'name': 's', 'dist': 'norm', 'params': {'loc': .2, 'scale': .2}}
+        ],
+        'limit_state': 'batch_limit_state:g',
+        'nsamples': 200,
+        'seed': 1
+        }, **kwargs)
+
+class TestBatch(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(self):
+        print('\n***Batch.py tests:***\n') 
+        
+    @classmethod
+    def tearDownClass(self):
+        print('\n***Batch.py tests have finished***\n') 
+        
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = self.tmp.name
+        with open(os.path.join(self.path, 'batch_limit_state.py'), 'w') as f:
+            f.write(LIMIT_STATE)
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def write_config(self, config):
+        path = os.path.join(self.path, 'config.json')
+        with open(path, 'w') as f:
+            json.dump(config, f)
+        return path
+    
+    def test_get_variable(self):
+        print('test_get_variable')
+        specs = [{'type': 'd', 'name': 'a', 'params': 1.},
+                 {'type': 'i', 'name': 'e', 'params': [.3, .1]},
+                 {'type': 'c', 'name': 'c', 'dist': 'lognorm', 'params': {'s': .1}},
+                 {'type': 'p', 'name': 'p', 'params': [[0., 1.], [1., 1.]]},
+                 {'type': 'h', 'name': 'h', 'params': [1., 2., 3.]}]
+        classes = [Variables.Deterministic, Variables.Interval, Variables.Cdf,
+                   Variables.Pbox, Variables.Hist]
+        for spec, cls in zip(specs, classes):
+            self.assertIsInstance(Batch.get_variable(spec), cls)
+        self.assertEqual(Batch.get_variable(specs[1]).get_bounds(.5), (.1, .3))
+        self.assertRaises(TypeError, Batch.get_variable, {'type': 'x', 'name': 'x', 'params': 1.})
+        
+    def test_load_config(self):
+        print('test_load_config')
+        config = Batch.load_config(self.write_config(get_config()))
+        self.assertEqual(config['method'], 'scipy')
+        self.assertEqual(config['nsamples'], 200)
+        self.assertRaises(ValueError, Batch.load_config, self.write_config({'variables': []}))
+        self.assertRaises(ValueError, Batch.load_config, self.write_config(get_config(nsample=1)))
+        self.assertRaises(ValueError, Batch.load_function, 'batch_limit_state.g')
+        
+    def test_main(self):
+        print('test_main')
+        output = os.path.join(self.path, 'out', 'results.json')
+        path = self.write_config(get_config(args=[.1], sampler='lhs'))
+        self.assertEqual(Batch.main(['run', path, '--output', output]), 0)
+        
+        def strict(constant):
+            raise ValueError(f'{constant} is not valid JSON')
+        with open(output) as f:
+            res = json.load(f, parse_constant=strict)
+        self.assertEqual(res['nsamples'], 200)
+        self.assertEqual(res['batches'], 1)
+        self.assertGreaterEqual(res['pf'][0], res['pf'][1])
+        self.assertEqual(res['pf'][1], 0.)
+        self.assertIsNone(res['b'][1])                                         # pf = 0
+        self.assertIsNone(res['cov'][1])
+        self.assertGreater(res['metrics']['nfev'], 0)
+        self.assertGreater(res['metrics']['timers']['sampling'], 0)
+        self.assertGreater(res['metrics']['timers']['bounds'], 0)
+        self.assertGreater(res['time'], 0)
+        self.assertEqual(res['config']['output'], output)
+        
+    def test_run_cov(self):
+        print('test_run_cov')
+        config = Batch.load_config(self.write_config(get_config(method='line', nsamples=10,
+                                                                cov=.01)))
+        res = Batch.run(config, paths=[self.path])
+        self.assertLessEqual(max(res['cov']), .01)
+        self.assertEqual(res['nsamples'], 10*res['batches'])
+        
+        config = dict(config, method='scipy', cov=1e-6, max_samples=30)
+        self.assertEqual(Batch.run(config, paths=[self.path])['nsamples'], 30)
+        
+    def test_run_queue(self):
+        print('test_run_queue')
+        queue = os.path.join(self.path, 'queue')
+        config = Batch.load_config(self.write_config(get_config(queue=queue, shard_size=50)))
+        thread = threading.Thread(target=Cluster.worker, args=(queue,), kwargs={'poll': .01})
+        thread.start()
+        try:
+            res = Batch.run(config, paths=[self.path])
+        finally:
+            Cluster.WorkQueue(queue).stop()
+            thread.join()
+        ref = Batch.run(dict(config, queue=None), paths=[self.path])
+        np.testing.assert_allclose(res['pf'], ref['pf'])
+        
+    def test_run_workers(self):
+        print('test_run_workers')
+        # local worker processes run `python -m imprel.Batch worker`
+        os.symlink(os.path.dirname(os.path.abspath(Batch.__file__)), os.path.join(self.path, 'imprel'))
+        config = Batch.load_config(self.write_config(get_config(workers=2, shard_size=50)))
+        res = Batch.run(config, paths=[self.path])
+        ref = Batch.run(dict(config, workers=0), paths=[self.path])
+        np.testing.assert_allclose(res['pf'], ref['pf'])
+        self.assertEqual(res['nsamples'], 200)
+        
+        def start_workers(queue, n, paths=()):                                 # workers exiting at once
+            return [subprocess.Popen([sys.executable, '-c', 'pass']) for _ in range(n)]
+        with mock.patch.object(Batch, 'start_workers', start_workers):
+            self.assertRaises(ValueError, Batch.run, config, paths=[self.path])
+
+if __name__ == "__main__":
+    unittest.main()
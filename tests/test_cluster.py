@@ -0,0 +1,136 @@
+"""
+Unittests for file Cluster.py.
+
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+import threading
+import subprocess
+import time
+import numpy as np
+import Cluster
+import Runer
+import Variables
+import scipy.stats as stats
+
+def obj_func(x, d=0.):
+    return x[0]-x[1]-d
+
+def bad_func(x):
+    raise RuntimeError('limit state is broken')
+
+SLOW = threading.Event()
+
+def slow_func(x):
+    if SLOW.is_set():
+        time.sleep(.05)
+    return x[0]-x[1]
+
+def get_variables():
+    return [Variables.initiate_variable('p', 'r', [stats.norm(.7, .14),
+                                                   stats.norm(.8, .14)]),
+            Variables.initiate_variable('c', 's', stats.norm(.2, .2))]
+
+class TestCluster(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(self):
+        print('\n***Cluster.py tests:***\n') 
+        
+    @classmethod
+    def tearDownClass(self):
+        print('\n***Cluster.py tests have finished***\n') 
+        
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = self.tmp.name
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_QueueAnalysis(self):
+        print('test_QueueAnalysis')
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(
+            [os.path.dirname(os.path.abspath(Cluster.__file__)),
+             os.path.dirname(os.path.abspath(__file__))]))
+        code = 'import sys, Cluster; Cluster.worker(sys.argv[1], poll=.05, idle_timeout=60)'
+        workers = [subprocess.Popen([sys.executable, '-c', code, self.path], env=env)
+                   for _ in range(3)]
+        try:
+            plan = Runer.Plan(get_variables(), nsamples=50, seed=1)
+            res = Cluster.QueueAnalysis(plan.variables, obj_func, queue=self.path, shard_size=7,
+                                        plan=plan, args=(.1,), verbose=False)
+            Cluster.WorkQueue(self.path).stop()
+            for w in workers:
+                self.assertEqual(w.wait(timeout=60), 0)
+        finally:
+            for w in workers:
+                w.kill()
+        
+        ref = plan.run(obj_func, args=(.1,), verbose=False)
+        self.assertEqual(sorted(res.results), list(range(50)))
+        np.testing.assert_allclose(res.ymin, ref.ymin, atol=1e-8)
+        np.testing.assert_allclose(res.ymax, ref.ymax, atol=1e-8)
+        self.assertEqual(res.pf, ref.pf)
+        self.assertEqual(len(res.metrics.samples), 50)
+        self.assertGreater(res.metrics.nfev, 0)
+        
+    def test_requeue(self):
+        print('test_requeue')
+        queue = Cluster.WorkQueue(self.path, timeout=1.)
+        samples = np.random.uniform(size=(10, 2))
+        queue.submit({'variables': get_variables(), 'obj_function': obj_func,
+                      'method': 'scipy', 'args': ()},
+                     [{'nums': list(range(5)), 'samples': samples[:5], 'x0': None},
+                      {'nums': list(range(5, 10)), 'samples': samples[5:], 'x0': None}])
+        
+        running, shard = queue.claim('dead')                                   # worker died
+        self.assertEqual(queue.requeue(), 0)
+        os.utime(running, (0, 0))
+        self.assertEqual(queue.requeue(), 1)
+        
+        self.assertEqual(Cluster.worker(self.path, poll=.01, idle_timeout=.1), 2)
+        results = queue.collect()
+        self.assertEqual(sorted(results), [0, 1])
+        self.assertEqual(sorted(results[1]['results']), list(range(5, 10)))
+        
+    def test_failures(self):
+        print('test_failures')
+        queue = Cluster.WorkQueue(self.path, retries=2, poll=.01)
+        queue.submit({'variables': get_variables(), 'obj_function': bad_func,
+                      'method': 'scipy', 'args': ()},
+                     [{'nums': [0], 'samples': np.array([[.5, .5]]), 'x0': None}])
+        thread = threading.Thread(target=Cluster.worker, args=(self.path,),
+                                  kwargs={'poll': .01, 'idle_timeout': .5})
+        thread.start()
+        with self.assertRaisesRegex(ValueError, 'limit state is broken'):
+            queue.collect()
+        thread.join()
+        self.assertEqual(queue.files('pending'), [])
+
+    def test_revoked(self):
+        print('test_revoked')
+        queue = Cluster.WorkQueue(self.path, timeout=.3, poll=.01)
+        queue.submit({'variables': get_variables(), 'obj_function': slow_func,
+                      'method': 'scipy', 'args': ()},
+                     [{'nums': list(range(5)), 'samples': np.random.uniform(size=(5, 2)), 'x0': None}])
+        SLOW.set()
+        thread = threading.Thread(target=Cluster.worker, args=(self.path,),
+                                  kwargs={'poll': .01, 'idle_timeout': .5})
+        thread.start()
+        try:
+            while queue.requeue() == 0:                                        # slow worker
+                time.sleep(.01)
+        finally:
+            SLOW.clear()
+        results = queue.collect()
+        thread.join()
+        
+        self.assertEqual(sorted(results), [0])
+        self.assertEqual(len(queue.failures()[0]), 1)                          # revoked claim is no failure
+
+if __name__ == "__main__":
+    unittest.main()
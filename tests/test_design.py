@@ -0,0 +1,76 @@
+"""
+Unittests for file Design.py.
+
+"""
+
+import unittest
+import numpy as np
+import Design
+import Variables
+import scipy.stats as stats
+
+class TestDesign(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(self):
+        print('\n***Design.py tests:***\n') 
+        
+    @classmethod
+    def tearDownClass(self):
+        print('\n***Design.py tests have finished***\n') 
+    
+    def test_sensitivity(self):
+        print('test_sensitivity')
+        variables=[Variables.initiate_variable('c', 'r', stats.norm(1., .1)),
+                   Variables.initiate_variable('c', 's', stats.norm(1., .1))]
+        
+        def obj_func(x, d):
+            return d[0]*x[0]-x[1]
+        
+        opt = Design.DesignOptimization(variables, obj_func, cost=lambda d: d[0],
+                                        nsamples=2000, seed=1, verbose=False)
+        s = opt.sensitivity([1.3])
+        self.assertIs(opt.sensitivity([1.3]), s)                               # cached
+        
+        h = 1e-3
+        b_p = opt.sensitivity([1.3 + h])['b']
+        b_m = opt.sensitivity([1.3 - h])['b']
+        self.assertAlmostEqual(s['db'][0], (b_p - b_m)/(2*h), delta=.1*abs(s['db'][0]))
+        self.assertGreater(s['db'][0], 0)
+        self.assertRaises(ValueError, Design.DesignOptimization, variables, obj_func,
+                          lambda d: d[0], bound='middle')
+        for method in ('line', 'directional'):
+            self.assertRaises(ValueError, Design.DesignOptimization, variables, obj_func,
+                              lambda d: d[0], method=method)
+        
+    def test_optimize(self):
+        print('test_optimize')
+        variables=[Variables.initiate_variable('p', 'r', [stats.norm(.95, .1),
+                                                          stats.norm(1.05, .1)]),
+                   Variables.initiate_variable('c', 's', stats.norm(1., .1))]
+        
+        def obj_func(x, d):
+            return d[0]*x[0]-x[1]
+        
+        opt = Design.DesignOptimization(variables, obj_func, cost=lambda d: d[0],
+                                        beta_target=2., nsamples=200, seed=1, verbose=False)
+        res = opt.optimize(d0=[1.6], bounds=[(1., 3.)])
+        
+        self.assertTrue(res.success)
+        self.assertAlmostEqual(res.b_smoothed, 2., delta=.05)                 # constraint
+        self.assertEqual(res.b, res.analysis.b[0])
+        self.assertAlmostEqual(res.b, 2., delta=.2)
+        
+        ds = [h['d'] for h in opt.history] + [a.args[0] for a in opt.analyses]
+        for d in ds:                                                           # not aliased to SLSQP array
+            self.assertFalse(np.shares_memory(d, res.x))
+        self.assertNotEqual(opt.history[0]['d'][0], res.x[0])
+        self.assertGreater(len({d[0] for d in ds}), 1)
+        self.assertEqual(len({a.args[0][0] for a in opt.analyses}), len(opt.analyses))
+        self.assertLess(res.x[0], 1.6)
+        self.assertEqual(len(opt.analyses[0].results), 200)
+        self.assertTrue((opt.analyses[-1].samples == opt.plan.samples).all())   # samples are reused
+        self.assertGreater(opt.nfev, 0)
+
+if __name__ == "__main__":
+    unittest.main()
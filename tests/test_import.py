@@ -0,0 +1,54 @@
+"""
+Unittests for the import time of the package modules.
+
+"""
+
+import unittest
+import os
+import subprocess
+import sys
+import utils
+
+# Budget for importing all modules in a fresh interpreter (numpy included)
+IMPORT_TIME_BUDGET = 1.0                                                       # s
+
+# Modules which have to be loaded lazily on the first use
+HEAVY_MODULES = ['matplotlib', 'scipy.stats', 'scipy.optimize', 'scipy.interpolate']
+
+CODE = """
+import sys, time
+t = time.perf_counter()
+import utils, Metrics, Response, Variables, Runer, Design, Cluster, Batch
+t = time.perf_counter() - t
+print(t)
+print(','.join(m for m in {} if m in sys.modules))
+""".format(HEAVY_MODULES)
+
+class TestImport(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(self):
+        print('\n***import tests:***\n') 
+        
+    @classmethod
+    def tearDownClass(self):
+        print('\n***import tests have finished***\n') 
+        
+    def setUp(self):
+        pass
+    
+    def tearDown(self):
+        pass
+    
+    def test_import_time(self):
+        print('test_import_time')
+        out = subprocess.run([sys.executable, '-c', CODE], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(utils.__file__)), check=True)
+        t, loaded = out.stdout.splitlines()[-2:]
+        print('import time:', t, 's')
+        self.assertEqual(loaded, '')
+        self.assertGreater(IMPORT_TIME_BUDGET, float(t))
+
+
+if __name__ == "__main__":
+    unittest.main()
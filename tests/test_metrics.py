@@ -0,0 +1,68 @@
+"""
+Unittests for file Metrics.py.
+
+"""
+
+import unittest
+import time
+import Metrics
+
+class TestMetrics(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(self):
+        print('\n***Metrics.py tests:***\n') 
+        
+    @classmethod
+    def tearDownClass(self):
+        print('\n***Metrics.py tests have finished***\n') 
+        
+    def setUp(self):
+        pass
+    
+    def tearDown(self):
+        pass
+    
+    def test_timer(self):
+        print('test_timer')
+        m = Metrics.Metrics()
+        with m.timer('sampling'):
+            time.sleep(.01)
+        with m.timer('sampling'):
+            time.sleep(.01)
+        self.assertGreater(m.timers['sampling'], .02)
+        self.assertEqual(m.timers['bounds'], 0.)
+        self.assertAlmostEqual(m.time, sum(m.timers.values()))
+        
+    def test_count(self):
+        print('test_count')
+        m = Metrics.Metrics()
+        f = m.count(lambda x, a=0: x[0] + a)
+        self.assertEqual(f([1.]), 1.)
+        self.assertEqual(f([1.], 2.), 3.)
+        self.assertEqual(m.nfev, 2)
+        
+    def test_record(self):
+        print('test_record')
+        m = Metrics.Metrics()
+        m.record(0, nfev=10, nit=3)
+        m.record(0, nfev=5, nit=2, failures=1)
+        m.record(1, nfev=1)
+        self.assertEqual(m.samples[0], {'nfev': 15, 'nit': 5, 'failures': 1})
+        self.assertEqual(m.nit, 5)
+        self.assertEqual(m.failures, 1)
+        self.assertEqual(m.as_dict()['samples'][1]['nfev'], 1)
+        
+    def test_progress(self):
+        print('test_progress')
+        m = Metrics.Metrics()
+        time.sleep(.01)
+        report = m.progress(5, 10)
+        self.assertEqual(report['done'], 5)
+        self.assertEqual(report['total'], 10)
+        self.assertGreater(report['rate'], 0)
+        self.assertAlmostEqual(report['eta'], report['elapsed'], places=6)
+
+
+if __name__ == "__main__":
+    unittest.main()
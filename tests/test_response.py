@@ -0,0 +1,70 @@
+"""
+Unittests for file Response.py.
+
+"""
+
+import unittest
+import numpy as np
+import Response
+import utils
+
+class TestResponse(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(self):
+        print('\n***Response.py tests:***\n') 
+        
+    @classmethod
+    def tearDownClass(self):
+        print('\n***Response.py tests have finished***\n') 
+        
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.ymin = rng.normal(10., 2., size=1000)
+        self.ymax = self.ymin + rng.uniform(0., 1., size=1000)
+        self.resp = Response.Response(self.ymin, self.ymax)
+    
+    def tearDown(self):
+        pass
+    
+    def test_pf(self):
+        print('test_pf')
+        thresholds = np.linspace(5., 15., 30)
+        pfs = self.resp.pf(thresholds)
+        for t, pf_min, pf_max in zip(thresholds, *pfs):
+            self.assertEqual(pf_min, utils.pf(self.ymin - t))
+            self.assertEqual(pf_max, utils.pf(self.ymax - t))
+        self.assertTrue((pfs[0] >= pfs[1]).all())
+        self.assertEqual(self.resp.pf(), (0., 0.))
+        
+    def test_cdf(self):
+        print('test_cdf')
+        cdf = self.resp.cdf(np.sort(self.ymin))
+        np.testing.assert_allclose(cdf[0], np.arange(1, 1001) / 1000)
+        self.assertTrue((cdf[0] >= cdf[1]).all())
+        self.assertEqual(self.resp.cdf(-np.inf), (0., 0.))
+        self.assertEqual(self.resp.cdf(np.inf), (1., 1.))
+        
+    def test_quantile(self):
+        print('test_quantile')
+        q = self.resp.quantile([0., .5, 1.])
+        self.assertEqual(q[0][0], self.ymin.min())
+        self.assertEqual(q[1][-1], self.ymax.max())
+        self.assertTrue((self.resp.cdf(q[0])[0] >= [0., .5, 1.]).all())
+        self.assertRaises(ValueError, self.resp.quantile, 1.5)
+        
+    def test_merge(self):
+        print('test_merge')
+        r1 = Response.Response(self.ymin[:300], self.ymax[:300])
+        r2 = Response.Response(self.ymin[300:700], self.ymax[300:700])
+        r3 = Response.Response(self.ymin[700:])
+        merged = r1.merge(r2, r3)
+        
+        self.assertEqual(merged.nsamples, 1000)
+        self.assertTrue(merged.imprecise)
+        np.testing.assert_array_equal(merged.ymin, np.sort(self.ymin))
+        np.testing.assert_array_equal(merged.ymax, np.sort(np.r_[self.ymax[:700], self.ymin[700:]]))
+        self.assertFalse(Response.Response(self.ymin).merge(Response.Response(self.ymax)).imprecise)
+
+if __name__ == "__main__":
+    unittest.main()
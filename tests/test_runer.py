@@ -4,6 +4,7 @@ Unittests for file Runer.py.
 """
 
 import unittest
+import numpy as np
 import Runer
 import Variables
 import scipy.stats as stats
@@ -206,5 +207,200 @@ class TestRuner(unittest.TestCase):
         self.assertGreater(0.2, diff1)
         self.assertGreater(0.2, diff2)
 
+    def test_Analysis_metrics(self):
+        print('test_Analysis_metrics')
+        
+        def obj_func(x):
+            return x[0]-x[1]
+        
+        reports = []
+        variables=[Variables.initiate_variable('p', 'r', [stats.norm(.7, .14),
+                                                          stats.norm(.8, .14)]),
+                   Variables.initiate_variable('c', 's', stats.norm(.2, .2))]
+        
+        res = Runer.Analysis(variables, obj_function=obj_func, method='scipy',
+                             nsamples=20, verbose=False, callback=reports.append)
+        
+        self.assertEqual(len(reports), 20)
+        self.assertEqual(reports[-1]['done'], 20)
+        self.assertEqual(len(res.metrics.samples), 20)
+        self.assertEqual(res.metrics.nfev,
+                         sum(s['nfev'] for s in res.metrics.samples.values()))
+        self.assertGreater(res.metrics.nit, 0)
+        self.assertEqual(res.metrics.failures, 0)
+        self.assertGreater(res.time, 0)
+        self.assertEqual(set(res.metrics.timers),
+                         {'sampling', 'bounds', 'optimization', 'aggregation'})
+
+class TestPlan(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(self):
+        print('\n***Runer.py Plan tests:***\n') 
+        
+    @classmethod
+    def tearDownClass(self):
+        print('\n***Runer.py Plan tests have finished***\n') 
+    
+    def test_Plan(self):
+        print('test_Plan')
+        variables=[Variables.initiate_variable('p', 'r', [stats.norm(.7, .14),
+                                                          stats.norm(.8, .14)]),
+                   Variables.initiate_variable('c', 's', stats.norm(.2, .2))]
+        plan = Runer.Plan(variables, nsamples=50, seed=1)
+        
+        self.assertEqual(plan.bounds.shape, (50, 2, 2))
+        self.assertEqual(plan.nsamples, 50)
+        self.assertTrue(plan.imprecise)
+        self.assertTrue((plan.x0[0] >= plan.bounds[..., 0]).all())
+        self.assertTrue((plan.x0[1] <= plan.bounds[..., 1]).all())
+        
+        def obj_func(x, d=0.):
+            return x[0]-x[1]-d
+        
+        res1 = plan.run(obj_func, verbose=False)
+        res2 = plan.run(obj_func, verbose=False)
+        self.assertEqual(res1.pf, res2.pf)                                     # common random numbers
+        self.assertEqual(res1.metrics.timers['bounds'], 0.)                    # bounds are reused
+        
+        res = plan.run_many(obj_func, [(0.,), (.2,), (.4,)], verbose=False)
+        pfs = [r.pf[0] for r in res]
+        self.assertEqual(pfs[0], res1.pf[0])
+        self.assertEqual(pfs, sorted(pfs))
+        
+        resp = res1.response()
+        self.assertEqual(resp.pf(0.), res1.pf)
+        self.assertEqual(resp.pf([.2])[0][0], pfs[1])
+        
+    def test_Plan_system(self):
+        print('test_Plan_system')
+        variables=[Variables.initiate_variable('c', 'r', stats.norm(.8, .14)),
+                   Variables.initiate_variable('c', 's', stats.norm(.2, .2))]
+        plan = Runer.Plan(variables, nsamples=2000, seed=2)
+        
+        g1 = lambda x: x[0]-x[1]
+        g2 = lambda x: 1.2*x[0]-x[1]-.3
+        
+        pf1 = plan.run(g1, verbose=False).pf[0]
+        pf2 = plan.run(g2, verbose=False).pf[0]
+        series = plan.run_system([g1, g2], kind='series', verbose=False)
+        parallel = plan.run_system([g1, g2], kind='parallel', verbose=False)
+        
+        self.assertGreaterEqual(series.pf[0], max(pf1, pf2))
+        self.assertLessEqual(series.pf[0], pf1 + pf2)
+        self.assertLessEqual(parallel.pf[0], min(pf1, pf2))
+        self.assertEqual(len(series.results), 2000)
+        self.assertRaises(ValueError, plan.run_system, [g1, g2], 'mixed')
+
+class TestSampling(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(self):
+        print('\n***Runer.py directional and line sampling tests:***\n') 
+        
+    @classmethod
+    def tearDownClass(self):
+        print('\n***Runer.py directional and line sampling tests have finished***\n') 
+    
+    def test_line(self):
+        print('test_line')
+        variables=[Variables.initiate_variable('p', 'r', [stats.norm(.9, .14),
+                                                          stats.norm(1., .14)]),
+                   Variables.initiate_variable('c', 's', stats.norm(.2, .2))]
+        res = Runer.Analysis(variables, obj_function=lambda x: x[0]-x[1], method='line',
+                             nsamples=50, verbose=False)
+        
+        self.assertAlmostEqual(res.b[0], beta(.9, .14, .2, .2), places=4)      # linear limit state
+        self.assertAlmostEqual(res.b[1], beta(1., .14, .2, .2), places=4)
+        self.assertLess(res.cov[0], 1e-3)
+        self.assertEqual(len(res.results), 50)
+        
+        res = Runer.Analysis(variables[1:], obj_function=lambda x: .8-x[0], method='line',
+                             nsamples=10, verbose=False, direction=[-1.])     # towards safe domain
+        self.assertAlmostEqual(res.b[0], 3., places=4)
+        self.assertEqual(res.pf[1], 0.)
+        
+    def test_directional(self):
+        print('test_directional')
+        variables=[Variables.initiate_variable('c', 'r', stats.norm(1., .14)),
+                   Variables.initiate_variable('c', 's', stats.norm(.2, .2))]
+        res = Runer.Analysis(variables, obj_function=lambda x: x[0]-x[1], method='directional',
+                             nsamples=2000, verbose=False)
+        pf = stats.norm.cdf(-beta(1., .14, .2, .2))
+        
+        self.assertAlmostEqual(res.pf[0], pf, delta=4*res.cov[0]*res.pf[0])
+        self.assertEqual(res.pf[1], 0.)
+        self.assertEqual(res.cov[1], np.inf)                                   # not converged
+        self.assertGreater(res.metrics.nfev, 2000)
+        
+        plan = Runer.Plan(variables, nsamples=10, seed=1)
+        self.assertRaises(ValueError, plan.run_system, [lambda x: x[0]-x[1]], 'series',
+                          'directional', verbose=False)
+
+class TestMultistart(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(self):
+        print('\n***Runer.py multi-start search tests:***\n') 
+        
+    @classmethod
+    def tearDownClass(self):
+        print('\n***Runer.py multi-start search tests have finished***\n') 
+    
+    def test_multistart(self):
+        print('test_multistart')
+        variables=[Variables.initiate_variable('i', 'r', 0., 3.),
+                   Variables.initiate_variable('c', 's', stats.norm(0., .2))]
+        obj_func = lambda x: np.cos(4*x[0])+.1*x[0]-x[1]                       # non-convex
+        grid = np.linspace(0., 3., 300001)
+        y = np.cos(4*grid)+.1*grid
+        plan = Runer.Plan(variables, nsamples=100, seed=1)
+        s = plan.bounds[:, 1, 0]
+        
+        res = plan.run(obj_func, method='multistart', verbose=False)
+        np.testing.assert_allclose(res.ymin, y.min()-s, atol=1e-4)
+        np.testing.assert_allclose(res.ymax, y.max()-s, atol=1e-4)
+        self.assertEqual(res.metrics.failures, 0)
+        
+        res_sys = plan.run_system([obj_func, obj_func], method='multistart', verbose=False)
+        self.assertEqual(res_sys.pf, res.pf)
+        
+    def test_multistart_vectorized(self):
+        print('test_multistart_vectorized')
+        variables=[Variables.initiate_variable('p', f'r{i}', [stats.norm(1., .1),
+                                                              stats.norm(1.2, .1)]) for i in range(3)]
+        variables.append(Variables.initiate_variable('c', 's', stats.norm(.5, .2)))
+        obj_func = lambda x: np.sort(x[:3])[0]-x[3]                            # not elementwise
+        plan = Runer.Plan(variables, nsamples=30, seed=1)
+        b = plan.bounds
+        
+        res = plan.run(obj_func, method='multistart', verbose=False)
+        np.testing.assert_allclose(res.ymin, b[:, :3, 0].min(axis=1)-b[:, 3, 0], atol=1e-8)
+        np.testing.assert_allclose(res.ymax, b[:, :3, 1].min(axis=1)-b[:, 3, 0], atol=1e-8)
+        
+        res = plan.run(lambda x: x[0]-x[3], method='multistart', verbose=False,
+                       options={'vectorized': True})
+        np.testing.assert_allclose(res.ymax, b[:, 0, 1]-b[:, 3, 0], atol=1e-8)
+        res = plan.run(obj_func, method='multistart', verbose=False, options={'vectorized': True})
+        for r in res.results.values():                                         # stored y is g(x)
+            self.assertEqual(r['min']['y'], obj_func(r['min']['x']))
+            self.assertEqual(r['max']['y'], obj_func(r['max']['x']))
+        
+    def test_multistart_failures(self):
+        print('test_multistart_failures')
+        variables=[Variables.initiate_variable('i', 'r', 0., 3.),
+                   Variables.initiate_variable('c', 's', stats.norm(0., .2))]
+        
+        def obj_func(x):
+            if 1. < x[0] < 3.:                                                 # SLSQP fails
+                return np.nan
+            return x[0]-x[1]
+        
+        res = Runer.Analysis(variables, obj_function=obj_func, method='multistart',
+                             nsamples=20, verbose=False, options={'nstarts': 1})
+        self.assertEqual(len(res.results), 20)
+        self.assertGreater(res.metrics.failures, 0)
+        self.assertTrue(np.isfinite(res.ymax).all())
+
 if __name__ == "__main__":
     unittest.main()
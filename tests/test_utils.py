@@ -64,8 +64,20 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(utils.get_probability_of_failure(-10), 1)
         
     def test_get_cdf(self):
-        print('test_get_cdf (pass)')
-        pass
+        print('test_get_cdf')
+        cdf, bins = utils.get_cdf([10., 20., 30., 40.], pplot=False)
+        self.assertEqual((bins[0], bins[-1]), (10. + 30./99, 40.))             # range of the data
+        self.assertEqual(cdf[-1], 1.)
+        self.assertAlmostEqual(cdf[np.searchsorted(bins, 25.)], .5)
+        
+        cdf, bins = utils.get_cdf([.1, .5, np.inf], pplot=False)               # infinite values left out
+        self.assertFalse(np.isnan(cdf).any())
+        self.assertEqual(cdf[-1], 1.)
+        self.assertEqual(bins[-1], .5)
+        
+        cdf, bins = utils.get_cdf([np.inf]*10, pplot=False)                    # SRA upper bounds
+        self.assertFalse(np.isnan(cdf).any())
+        self.assertFalse(np.isnan(bins).any())
 
 
 if __name__ == "__main__":